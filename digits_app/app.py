@@ -1,27 +1,115 @@
+from gevent import monkey
+
+# Patch the stdlib before Flask is imported so blocking I/O yields to other greenlets.
+monkey.patch_all()
+
+import json
 import os
 import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 path = os.path.dirname(os.path.dirname(__file__))
 sys.path.append(path)
 
 from flask import Blueprint, Flask, redirect, render_template, request, session, url_for
-from gevent.pywsgi import WSGIServer
 from wtforms import IntegerField
 
 from digits_app.forms import DigitsForm, GuessButtons, GuessForm
-from digits_app.src.clues.clue_generator import ClueGenerator
 from digits_app.src.constants import POS_RESPONSES
 from digits_app.src.main import Digits
-from digits_app.src.solver import Solver
+from digits_app.src.utility_methods import digits_to_num, num_to_digits
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "my-secret-key"
 digits_bp = Blueprint("digits_bp", __name__)
 
-app.config["SESSION_PERMANENT"] = False
-app.config["SESSION_TYPE"] = "filesystem"
+# Session state (answer, difficulty, digit count and clues) is small enough to live
+# in Flask's default signed-cookie session, so no server-side session store is used.
+
+MAP_FILES = Digits.load_map_files()
+"""Map files shared read-only by every request; per-game state lives in the session"""
+
+DIFFICULTY_BUTTONS = (
+    ("easy_btn", "easy"),
+    ("medium_btn", "medium"),
+    ("hard_btn", "hard"),
+)
+"""`DigitsForm` difficulty button fields and the difficulty they select"""
+
+NUM_DIGITS_BUTTONS = (
+    ("three_btn", 3),
+    ("four_btn", 4),
+    ("five_btn", 5),
+    ("six_btn", 6),
+)
+"""`DigitsForm` digit count button fields and the number of digits they select"""
+
+GUESS_ACTIONS = frozenset(
+    {"submit_guess", "submit_hint", "submit_reveal", "submit_play_again"}
+)
+"""Submit buttons on the guess page; each POST carries the one that was clicked"""
+
+
+@lru_cache(maxsize=4096)
+def _solve(
+    answer: int, difficulty: str
+) -> Optional[Tuple[Tuple[str, Tuple[str, ...]], ...]]:
+    """Generates and solves the clues for an answer.
+
+    Results are cached per (answer, difficulty) for the whole process, so games that
+    land on the same answer share the solver work across sessions and greenlets.
+
+    Returns:
+        Tuple of (clue_type, clue strings) pairs, or None if the answer is unsolvable.
+    """
+    # Imported on first solve; the landing page never needs the solver modules.
+    from digits_app.src.clues.clue_generator import ClueGenerator
+    from digits_app.src.solver import Solver
+
+    clue_gen = ClueGenerator(answer, difficulty)
+    solver = Solver(
+        clue_gen.digits,
+        clue_gen.num_maps,
+        clue_gen.clues,
+        difficulty,
+        MAP_FILES,
+    )
+    if solver.final_clues is None:
+        return None
+    return tuple(
+        (clue_type, tuple(str(clue) for clue in _clues))
+        for clue_type, _clues in solver.final_clues.items()
+    )
+
 
-digits_obj = Digits()
+@lru_cache(maxsize=4096)
+def _guess_clues(guess: int, difficulty: str) -> Mapping[str, FrozenSet[str]]:
+    """Generates the clues that apply to a guess, keyed by formatted clue type.
+
+    Cached per (guess, difficulty) and shared across sessions like `_solve`, so the
+    result is a read-only mapping. Clues are frozensets so hints can diff the
+    answer's clues with hash lookups.
+    """
+    from digits_app.src.clues.clue_generator import ClueGenerator
+    from digits_app.src.solver import Solver
+
+    guess_clue_gen = ClueGenerator(guess, difficulty)
+    return MappingProxyType(
+        {
+            Solver.format_clue_type(clue_key): frozenset(map(str, clues))
+            for clue_key, clues in guess_clue_gen.clues.items()
+        }
+    )
+
+
+def _dump_clues(final_clues: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> str:
+    """Serializes solved clues to the compact JSON string stored in the session.
+
+    The session serializer then handles one string instead of walking every clue.
+    """
+    return json.dumps(dict(final_clues), separators=(",", ":"))
 
 
 @digits_bp.route("/", methods=["GET", "POST"])
@@ -32,42 +120,25 @@ def digits():
             "digits.html",
             form=form,
         )
-    if form.easy_btn.data:
-        session["difficulty"] = "easy"
-    elif form.medium_btn.data:
-        session["difficulty"] = "medium"
-    elif form.hard_btn.data:
-        session["difficulty"] = "hard"
-
-    if form.three_btn.data:
-        session["num_digits"] = int(form.three_btn.name)
-    elif form.four_btn.data:
-        session["num_digits"] = int(form.four_btn.name)
-    elif form.five_btn.data:
-        session["num_digits"] = int(form.five_btn.name)
-    elif form.six_btn.data:
-        session["num_digits"] = int(form.six_btn.name)
+    for field, difficulty in DIFFICULTY_BUTTONS:
+        if form[field].data:
+            session["difficulty"] = difficulty
+            break
+
+    for field, num_digits in NUM_DIGITS_BUTTONS:
+        if form[field].data:
+            session["num_digits"] = num_digits
+            break
     solver_attempts = 3
 
     # Try to generate a solvable number up to 3 times before erroring.
     for _ in range(solver_attempts):
-        session["answer"] = digits_obj.generate_answer(session["num_digits"])
-        clue_gen = ClueGenerator(session["answer"], session["difficulty"])
-        solver = Solver(
-            clue_gen.digits,
-            clue_gen.num_maps,
-            clue_gen.clues,
-            session["difficulty"],
-            digits_obj.map_files,
-        )
-        if solver.final_clues is not None:
-            clue_dict = {
-                clue_type: [str(clue) for clue in _clues]
-                for clue_type, _clues in solver.final_clues.items()
-            }
-            session["clues"] = clue_dict
+        session["answer"] = Digits.random_answer(session["num_digits"])
+        final_clues = _solve(session["answer"], session["difficulty"])
+        if final_clues is not None:
+            session["clues_json"] = _dump_clues(final_clues)
             break
-    if session.get("clues"):
+    if session.get("clues_json"):
         return redirect(url_for("digits_bp.guess"))
     return render_template(
         "digits.html",
@@ -77,44 +148,54 @@ def digits():
 
 @digits_bp.route("/guess", methods=["GET", "POST"])
 def guess():
+    action = next(iter(request.form.keys() & GUESS_ACTIONS), None)
+    if action == "submit_play_again":
+        return redirect(url_for("digits_bp.digits"))
     num_digits = session.get("num_digits")
-    clues = session.get("clues")
     answer = session.get("answer")
-    guess_form = GuessForm(num_digits, request.form)
+    if answer is None:
+        return redirect(url_for("digits_bp.digits"))
+    clues_json = session.get("clues_json")
+    if clues_json is None:
+        # Only solve when the session has no clues; normally digits() stored them.
+        final_clues = _solve(answer, session.get("difficulty"))
+        if final_clues is None:
+            return redirect(url_for("digits_bp.digits"))
+        clues_json = session["clues_json"] = _dump_clues(final_clues)
+    clues: Dict[str, List[str]] = json.loads(clues_json)
+    guess_form = GuessForm(
+        num_digits, request.form if request.method == "POST" else None
+    )
     guess_buttons = GuessButtons()
-    highlighted_clues = []
-    guess_submitted = False
+    highlighted_clues = set()
+    guess_submitted = action == "submit_guess"
 
-    guess = None
     number = answer
-    guess_digits = [
-        str(getattr(guess_form, f"digit_{digit}").data or 0)
-        for digit in range(1, num_digits + 1)
-    ]
-    guess = int("".join(guess_digits))
-
-    if "submit_reveal" in request.form:
-        for i in range(num_digits):
-            digit_field: IntegerField = getattr(guess_form, f"digit_{i+1}")
-            digit_field.process_data(int(str(answer)[i]))
-
-    if "submit_hint" in request.form and guess != answer:
-        guess_clue_gen = ClueGenerator(guess, session.get("difficulty"))
-        guess_clues = {
-            Solver.format_clue_type(clue_key): list(map(str, clues))
-            for clue_key, clues in guess_clue_gen.clues.items()
-        }
+    # Parse the posted digit strings directly when each is a single digit, and only
+    # run the form's validators (and show their errors) when one is not.
+    raw_digits = [request.form.get(name, "") for name in guess_form._digit_fields]
+    guess = None
+    if all(len(raw) == 1 and raw.isdecimal() for raw in raw_digits):
+        guess = digits_to_num([int(raw) for raw in raw_digits])
+    elif action in ("submit_guess", "submit_hint") and guess_form.validate():
+        guess = digits_to_num(
+            [guess_form[name].data for name in guess_form._digit_fields]
+        )
+
+    if action == "submit_reveal":
+        for name, digit in zip(guess_form._digit_fields, num_to_digits(answer)):
+            digit_field: IntegerField = guess_form[name]
+            digit_field.process_data(digit)
+
+    elif action == "submit_hint" and guess is not None and guess != answer:
+        guess_clues = _guess_clues(guess, session.get("difficulty"))
         for clue_type, _clues in clues.items():
-            if len(guess_clues[clue_type]) > len(_clues):
-                highlighted_clues.append(_clues[-1])
-            unsatisfied_clues = list(
-                set(_clues).difference(set(guess_clues[clue_type]))
+            guess_clue_set = guess_clues[clue_type]
+            if len(guess_clue_set) > len(_clues):
+                highlighted_clues.add(_clues[-1])
+            highlighted_clues.update(
+                clue for clue in _clues if clue not in guess_clue_set
             )
-            highlighted_clues.extend(unsatisfied_clues)
-    if "submit_play_again" in request.form:
-        return redirect(url_for("digits_bp.digits"))
-    if "submit_guess" in request.form:
-        guess_submitted = True
     return render_template(
         "guess.html",
         form=guess_form,
@@ -131,6 +212,8 @@ def guess():
 app.register_blueprint(digits_bp)
 
 if __name__ == "__main__":
-    # http_server = WSGIServer(('', 5000), app)
-    # http_server.serve_forever()
-    app.run(debug=True, host="0.0.0.0")
+    from gevent.pool import Pool
+    from gevent.pywsgi import WSGIServer
+
+    http_server = WSGIServer(("", 5000), app, spawn=Pool(1000))
+    http_server.serve_forever()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from flask_wtf import FlaskForm
 from wtforms import BooleanField, Field, IntegerField, SelectField, SubmitField
 from wtforms.validators import InputRequired, NumberRange
@@ -19,6 +21,8 @@ class BooleanButtonField(Field):
         self.data = int(valuelist[0])
 
     def __call__(self, **kwargs):
+        if not kwargs:
+            return _button_html(self.name, self.class_, self.default_value)
         button_name = f"{self.name}"
         kwargs.setdefault("type", "button")
         kwargs.setdefault("id", button_name)
@@ -34,6 +38,16 @@ class BooleanButtonField(Field):
         return f"{hidden_input}<button {html_params_str}>{button_name}</button>"
 
 
+@lru_cache(maxsize=32)
+def _button_html(name: str, class_: str, default_value: int) -> str:
+    """Renders a `BooleanButtonField` without extra attributes once per button."""
+    hidden_input = f'<input type="hidden" name="{name}" value={default_value}>'
+    return (
+        f'{hidden_input}<button name="{name}" class="{class_}" type="button" '
+        f'id="{name}" value="{default_value}">{name}</button>'
+    )
+
+
 class DigitsForm(FlaskForm):
     play_btn = SubmitField("Play")
     easy_btn = BooleanButtonField(
@@ -71,18 +85,27 @@ class GuessButtons(FlaskForm):
     submit_reveal = SubmitField("Reveal")
 
 
-def GuessForm(*args, **kwargs):
+_DIGIT_VALIDATORS = (InputRequired(), NumberRange(min=0, max=9))
+_FIRST_DIGIT_VALIDATORS = (InputRequired(), NumberRange(min=1, max=9))
+
+
+@lru_cache(maxsize=8)
+def _guess_form_cls(num_digits: int):
+    """Builds the guess form class for a number of digits once and reuses it."""
+
     class StaticForm(FlaskForm):
         submit_guess = SubmitField("Guess")
         submit_hint = SubmitField("Hint")
-        num_digits = args[0]
 
-    for i in range(args[0]):
-        min_val = 1 if i == 0 else 0
-        field = IntegerField(
-            f"Digit {i+1}",
-            validators=[InputRequired(), NumberRange(min=min_val, max=9)],
-        )
+    StaticForm.num_digits = num_digits
+    for i in range(num_digits):
+        validators = _FIRST_DIGIT_VALIDATORS if i == 0 else _DIGIT_VALIDATORS
+        field = IntegerField(f"Digit {i+1}", validators=list(validators))
         setattr(StaticForm, f"digit_{i+1}", field)
+    StaticForm._digit_fields = tuple(f"digit_{i+1}" for i in range(num_digits))
 
-    return StaticForm()
+    return StaticForm
+
+
+def GuessForm(*args, **kwargs):
+    return _guess_form_cls(args[0])(*args[1:], **kwargs)
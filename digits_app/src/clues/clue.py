@@ -2,16 +2,22 @@
 from abc import abstractmethod
 from typing import List
 
-from digits_app.src.constants import INDEX_STRING_MAP
+from digits_app.src.constants import INDEX_STRINGS
 from digits_app.src.utility_methods import bold
 
 
 class Clue:
+    __slots__ = ("digits", "_display")
+
     def __init__(self, digits: List[str]) -> None:
         self.digits = digits
+        self._display = None
 
     def __str__(self) -> str:
-        return self.format_for_display()
+        """Formats the clue on first use; clues are immutable so the text is cached"""
+        if self._display is None:
+            self._display = self.format_for_display()
+        return self._display
 
     @abstractmethod
     def format_for_display(self):
@@ -19,30 +25,35 @@ class Clue:
 
 
 class OrderClue(Clue):
+    __slots__ = ("ascending", "descending")
+
+    keyword = bold("order")
+
     def __init__(self, digits: List[str], ascending: bool, descending: bool) -> None:
         super().__init__(digits)
         self.ascending = ascending
         self.descending = descending
-        self.keyword = bold("order")
 
     def format_for_display(self) -> str:
         """Formats the order of digits clue"""
-        base = "My digits are in {} {}"
         if self.ascending:
-            return base.format("ascending", self.keyword)
+            return f"My digits are in ascending {self.keyword}"
         elif self.descending:
-            return base.format("descending", self.keyword)
+            return f"My digits are in descending {self.keyword}"
         else:
             return f"My digits are not in ascending or descending {self.keyword}"
 
 
 class TotalSumClue(Clue):
+    __slots__ = ("no_great_digit", "digit", "comparison")
+
+    keyword = bold("total sum")
+
     def __init__(
         self, digits: List[str], digit: int = None, comparison: str = None
     ) -> None:
         super().__init__(digits)
         self.no_great_digit = True
-        self.keyword = bold("total sum")
         if digit is not None and comparison is not None:
             self.digit = digit
             self.comparison = comparison
@@ -52,16 +63,18 @@ class TotalSumClue(Clue):
         """Formats the sum clue"""
         if self.no_great_digit:
             return "No one of my digits is greater than the TOTAL SUM of the rest of my digits"
-        base = "My {} digit is {} the {} of all my other digits"
-        s_idx = INDEX_STRING_MAP[self.digit]
-        return base.format(s_idx, self.comparison, self.keyword)
+        s_idx = INDEX_STRINGS[self.digit]
+        return f"My {s_idx} digit is {self.comparison} the {self.keyword} of all my other digits"
 
 
 class EvenClue(Clue):
+    __slots__ = ("num_even",)
+
+    keyword = bold("even")
+
     def __init__(self, digits: List[str], num_even: int) -> None:
         super().__init__(digits)
         self.num_even = num_even
-        self.keyword = bold("even")
 
     def format_for_display(self) -> str:
         """Formats the even or odd clue"""
@@ -72,6 +85,15 @@ class EvenClue(Clue):
 
 
 class MultipleClue(Clue):
+    __slots__ = (
+        "limit",
+        "factor",
+        "multiple",
+        "multiplier",
+    )
+
+    keyword = bold("divided")
+
     def __init__(
         self,
         digits: List[str],
@@ -81,37 +103,26 @@ class MultipleClue(Clue):
         limit: int = None,
     ) -> None:
         super().__init__(digits)
-        self.keyword = bold("divided")
         self.limit = limit
         self.factor = factor
         self.multiple = multiple
         self.multiplier = multiplier
-        self.s_idx1 = INDEX_STRING_MAP.get(self.factor)
-        self.s_idx2 = INDEX_STRING_MAP.get(self.multiple)
-        self.bases = [
-            (
-                "My {} digit {} by {} equals my {} digit",
-                [self.s_idx2, self.keyword, self.multiplier, self.s_idx1],
-            ),
-            (
-                "My {} digit {} by any numer equals my {} digit",
-                [self.s_idx1, self.keyword, self.s_idx2],
-            ),
-        ]
 
     def format_for_display(self):
         """Formats the multiples clue"""
         if self.limit is not None:  # no multiples case
             return f"None of my digits {self.keyword} by factors 1-{self.limit} equal another digit"
+        s_idx1 = INDEX_STRINGS[self.factor]
+        s_idx2 = INDEX_STRINGS[self.multiple]
         if self.multiplier == -1:  # zero divided by zero case
-            base = self.bases[1]
-        else:  # different numbers, multiples of each other or same number for both digits, but not zeros
-            base = self.bases[0]
-
-        return base[0].format(*base[1])
+            return f"My {s_idx1} digit {self.keyword} by any numer equals my {s_idx2} digit"
+        # different numbers, multiples of each other or same number for both digits, but not zeros
+        return f"My {s_idx2} digit {self.keyword} by {self.multiplier} equals my {s_idx1} digit"
 
 
 class SpecialPropertiesClue(Clue):
+    __slots__ = ("keyword", "empty", "first_idx", "second_idx")
+
     def __init__(
         self, digits: List[str], attribute: str, special_digs: int = None
     ) -> None:
@@ -119,24 +130,31 @@ class SpecialPropertiesClue(Clue):
         self.keyword = bold(attribute)
         self.empty = True
         if special_digs is not None:
-            s_digs = str(special_digs)
-            self.first = s_digs[0]
-            self.second = None if len(s_digs) == 1 else s_digs[1]
+            # Single digits are stored as their 1-indexed position and joined digits
+            # as the two 1-indexed positions written side by side (e.g. 14)
+            if special_digs >= 10:
+                self.first_idx = special_digs // 10 - 1
+                self.second_idx = special_digs % 10 - 1
+            else:
+                self.first_idx = special_digs - 1
+                self.second_idx = None
             self.empty = False
 
     def format_for_display(self):
         if self.empty:
             return f"None of my digits or joining of my digits makes a {self.keyword} number."
-        s_idx1 = INDEX_STRING_MAP[int(self.first) - 1]
-        s_idx2 = None if not self.second else INDEX_STRING_MAP[int(self.second) - 1]
-        if not s_idx2:
+        s_idx1 = INDEX_STRINGS[self.first_idx]
+        if self.second_idx is None:
             return f"My {s_idx1} digit is a {self.keyword} number"
+        s_idx2 = INDEX_STRINGS[self.second_idx]
         return (
             f"Joining my {s_idx1} through {s_idx2} digits makes a {self.keyword} number"
         )
 
 
 class PartialsClue(Clue):
+    __slots__ = ("t_idx", "f1_idx", "f2_idx", "keyword")
+
     def __init__(
         self,
         digits: List[str],
@@ -153,9 +171,9 @@ class PartialsClue(Clue):
 
     def format_for_display(self):
         """Formats the partial clues"""
-        st_idx = INDEX_STRING_MAP.get(self.t_idx, None)
-        s_idx1 = INDEX_STRING_MAP.get(self.f1_idx, None)
-        s_idx2 = INDEX_STRING_MAP.get(self.f2_idx, None)
-        if all([st_idx, s_idx1, s_idx2]):
-            return f"My {st_idx} digit is the {self.keyword} of my {s_idx1} and {s_idx2} digits"
-        return f"None of my digits are the {self.keyword} of a combination of two of my other digits."
+        if self.t_idx is None or self.f1_idx is None or self.f2_idx is None:
+            return f"None of my digits are the {self.keyword} of a combination of two of my other digits."
+        st_idx = INDEX_STRINGS[self.t_idx]
+        s_idx1 = INDEX_STRINGS[self.f1_idx]
+        s_idx2 = INDEX_STRINGS[self.f2_idx]
+        return f"My {st_idx} digit is the {self.keyword} of my {s_idx1} and {s_idx2} digits"
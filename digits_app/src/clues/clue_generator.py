@@ -1,10 +1,10 @@
 """Clue generator application for any given number."""
-from typing import Callable, Dict, List, Tuple, Type
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 import digits_app.src.clues.clue as c
 import digits_app.src.clues.clue_map as cm
 import numpy as np
-from digits_app.src.constants import CLUES
+from digits_app.src.constants import CLUE_DISPATCH
 from digits_app.src.utility_methods import num_to_digits
 
 
@@ -34,12 +34,10 @@ class ClueGenerator:
         """
         all_clues = {}
         maps = {}
-        for clue, _kwargs in CLUES.items():
-            for kwargs in _kwargs.values():
-                new_clues, clue_map = getattr(self, f"generate_{clue}_clues")(**kwargs)
-                key = kwargs.get("attribute") or clue
-                all_clues[key] = new_clues
-                maps[str(clue_map)] = clue_map.num_map
+        for generate, key, kwargs in _CLUE_DISPATCH:
+            new_clues, clue_map = generate(self, **kwargs)
+            all_clues[key] = new_clues
+            maps[str(clue_map)] = clue_map.num_map
         return all_clues, maps
 
     def generate_multiples_clues(
@@ -62,13 +60,13 @@ class ClueGenerator:
 
         multiples_exist = np.any(map)
         if multiples_exist:
-            for i, factors in enumerate(map):
-                for j, dig in enumerate(factors):
-                    if 0 < dig <= limit or dig == -1:
-                        clue = c.MultipleClue(
-                            self.digits, factor=j, multiple=i, multiplier=dig
-                        )
-                        multiples_clues.append(clue)
+            # Row-major (multiple, factor) pairs of every related pair of digits
+            coords = np.argwhere(((map > 0) & (map <= limit)) | (map == -1))
+            for i, j in coords.tolist():
+                clue = c.MultipleClue(
+                    self.digits, factor=j, multiple=i, multiplier=int(map[i, j])
+                )
+                multiples_clues.append(clue)
         else:
             clue = c.MultipleClue(self.digits, limit=limit)
             multiples_clues.append(clue)
@@ -157,3 +155,10 @@ class ClueGenerator:
         if len(stm.num_map) == 0:
             clues.append(c.SpecialPropertiesClue(self.digits, attribute, None))
         return clues, stm
+
+
+_CLUE_DISPATCH: Tuple[Tuple[Callable, str, Dict[str, Any]], ...] = tuple(
+    (getattr(ClueGenerator, f"generate_{clue}_clues"), key, kwargs)
+    for clue, key, kwargs in CLUE_DISPATCH
+)
+"""`CLUE_DISPATCH` records with the clue type resolved to its generation function"""
@@ -1,11 +1,45 @@
 """Classes for generating numeric maps for each clue type."""
 import itertools
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 
 
+def _build_factor_table() -> np.ndarray:
+    """Builds a 10x10 table of the factor relating every pair of single digits.
+
+    `table[a, b]` is the whole number `a / b`, 0 when `a` is not a multiple of `b`
+    (including any non-zero digit divided by zero), and -1 for zero divided by zero.
+    """
+    table = np.zeros((10, 10), dtype=np.int8)
+    for a in range(10):
+        for b in range(10):
+            if b == 0:
+                table[a, b] = -1 if a == 0 else 0
+            elif a % b == 0:
+                table[a, b] = a // b
+    return table
+
+
+_FACTOR_TABLE = _build_factor_table()
+"""Factors relating each pair of digits, indexed by (multiple, factor)"""
+
+
+@lru_cache(maxsize=None)
+def _limited_factor_table(limit: int) -> np.ndarray:
+    """`_FACTOR_TABLE` with every factor greater than `limit` set to 0.
+
+    Applying the limit to the 10x10 table once per limit means building a map only
+    has to gather from it, instead of masking every map.
+    """
+    table = _FACTOR_TABLE.copy()
+    table[table > limit] = 0
+    table.flags.writeable = False
+    return table
+
+
 class ClueMapBase:
     """Builds a map of clues for the provided digits.
 
@@ -41,11 +75,26 @@ class OrderClueMap(ClueMapBase):
         Returns:
             Ascending, descending, and number map representation.
         """
-        ascending = all(cur <= next for cur, next in zip(self.digits, self.digits[1:]))
-        descending = all(cur >= next for cur, next in zip(self.digits, self.digits[1:]))
+        # One pass over adjacent digits settles both orders, stopping once neither holds
+        ascending = descending = True
+        for cur, next in zip(self.digits, self.digits[1:]):
+            if cur > next:
+                ascending = False
+            elif cur < next:
+                descending = False
+            if not (ascending or descending):
+                break
         num_map = [int(ascending), int(descending)]
         return ascending, descending, num_map
 
+    @staticmethod
+    def build_maps(digits: np.ndarray) -> np.ndarray:
+        """Vectorized `build_clue` for a (N, D) array of the digits of N numbers."""
+        steps = np.diff(digits, axis=1)
+        ascending = np.all(steps >= 0, axis=1)
+        descending = np.all(steps <= 0, axis=1)
+        return np.stack([ascending, descending], axis=1).astype(np.int8)
+
 
 class TotalSumClueMap(ClueMapBase):
     """Clue map for the Total Sum clue type."""
@@ -78,6 +127,16 @@ class TotalSumClueMap(ClueMapBase):
 
         return comparisons, comp_map
 
+    @staticmethod
+    def build_maps(digits: np.ndarray) -> np.ndarray:
+        """Vectorized `build_clue` for a (N, D) array of the digits of N numbers.
+
+        A digit is greater than the sum of the others when it is more than half of
+        the total sum, so the comparison is the sign of `2 * digit - total`.
+        """
+        total = digits.sum(axis=1, keepdims=True, dtype=np.int16)
+        return np.sign(2 * digits - total).astype(np.int8)
+
 
 class EvenClueMap(ClueMapBase):
     """Clue map for the Even clue type."""
@@ -94,6 +153,11 @@ class EvenClueMap(ClueMapBase):
         self.num_even = num_map.count(1)
         return num_map
 
+    @staticmethod
+    def build_maps(digits: np.ndarray) -> np.ndarray:
+        """Vectorized `build_clue` for a (N, D) array of the digits of N numbers."""
+        return ((digits & 1) == 0).astype(np.int8)
+
 
 class MultiplesClueMap(ClueMapBase):
     """Clue map for the Multiples clue type."""
@@ -131,38 +195,13 @@ class MultiplesClueMap(ClueMapBase):
         Returns:
             map: Map of each digit's factors relative to other digits.
         """
-        d = np.array(digits)
-
-        # Ignore zero division warnings
-        with np.errstate(divide="ignore", invalid="ignore"):
-            # Broadcast from 1xN to NxN matrix
-            # Outer divide by its original 1xN elements
-            map = d[:, np.newaxis] / d
-
-        # Edge case where multiple zeros exist in the number
-        # E.g. 10203
-        # TODO: Vectorize this
-        zeros = np.where(d == 0)[0]
-        if len(zeros) > 1:
-            map_copy = map.tolist()
-            for i, row in enumerate(map_copy):
-                row = [
-                    -1 if i in zeros and j in zeros and i != j else val
-                    for j, val in enumerate(row)
-                ]
-                map_copy[i] = row
-            map = np.array(map_copy)
-
-        # Set all floats to 0
-        map[map != map.astype(int)] = 0
-
-        map[map > limit] = 0
-
-        # Set all self-referencing factors to 0 using the identity matrix
-        map[map == np.identity(len(d))] = 0
-
-        # Convert all floats to integers to avoid needing to cast in clue formatting
-        map = map.astype(int)
+        d = np.asarray(digits)
+
+        # Broadcast from 1xN to NxN matrix and gather each pair's precomputed factor
+        map = _limited_factor_table(limit)[d[:, np.newaxis], d]
+
+        # Set all self-referencing factors to 0
+        np.fill_diagonal(map, 0)
 
         return map
 
@@ -212,13 +251,12 @@ class SpecialPropertiesClueMap(ClueMapBase):
         map = []
         for i, _ in enumerate(self.digits):
             limit = min(len(self.digits), i + self.limit)
+            cand = 0
             for j in range(i, limit):
-                # TODO: Maybe replace this logic with itertools.permutations?
-                cand = int("".join(str(dig) for dig in self.digits[i : j + 1]))
+                # Extend the joined digits i through j by one digit (Horner's rule)
+                cand = cand * 10 + self.digits[j]
                 if self.prop_func(cand):
-                    map.append(
-                        int("".join([str(i + 1), str(j + 1)]))
-                    ) if i != j else map.append(i + 1)
+                    map.append((i + 1) * 10 + (j + 1) if i != j else i + 1)
         map.sort()
         return map
 
@@ -269,12 +307,14 @@ class PartialsClueMap(ClueMapBase):
             map: Numeric representation of the partial function results.
 
         """
-        map = [[] for _ in self.digits]
-        for i, val in enumerate(self.digits):
-            for (j, x), (k, y) in itertools.combinations(
-                enumerate(self.digits), self.combo_size
-            ):
-                if j != i and k != i and self.prop_func(x, y, val):
+        digits = self.digits
+        map = [[] for _ in digits]
+        # The index pairs are the same for every target digit, so build them once
+        pairs = list(itertools.combinations(range(len(digits)), self.combo_size))
+        prop_func = self.prop_func
+        for i, val in enumerate(digits):
+            for j, k in pairs:
+                if j != i and k != i and prop_func(digits[j], digits[k], val):
                     map[i].append((j, k))
 
         return [tuple(sorted(row)) for row in map]
@@ -1,18 +1,19 @@
 """Constant values and settings."""
-import os
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-from digits_app.src.utility_methods import check_product, check_sum, is_fibonacci
-from sympy import is_perfect, isprime
+from digits_app.src.utility_methods import (
+    check_product,
+    check_sum,
+    is_fibonacci,
+    is_perfect_fast,
+    is_prime,
+)
 
-INDEX_STRING_MAP: Dict[int, str] = {
-    0: "1st",
-    1: "2nd",
-    2: "3rd",
-}
-INDEX_STRING_MAP.update({i: str(i + 1) + "th" for i in range(3, 11)})
-"""Map of 0-indexed keys to 1-indexed placement string"""
+INDEX_STRINGS: Tuple[str, ...] = ("1st", "2nd", "3rd") + tuple(
+    str(i + 1) + "th" for i in range(3, 11)
+)
+"""1-indexed placement strings indexed by 0-indexed digit position"""
 
 POS_RESPONSES = [
     "Wowowowow! That was it, good job!",
@@ -65,12 +66,12 @@ CLUES = {
     "total_sum": {"total_sum": {}},
     "special_properties": {
         "prime": {
-            "prop_func": isprime,
+            "prop_func": is_prime,
             "attribute": "prime",
             "limits": {"easy": {"length": 1}, "medium": {"length": 2}, "hard": {}},
         },
         "perfect": {
-            "prop_func": is_perfect,
+            "prop_func": is_perfect_fast,
             "attribute": "perfect",
             "limits": {"easy": {"length": 1}, "medium": {"length": 2}, "hard": {}},
         },
@@ -89,6 +90,13 @@ CLUES = {
 }
 """Clue types and their respective configuration settings"""
 
+CLUE_DISPATCH: Tuple[Tuple[str, str, Dict[str, Any]], ...] = tuple(
+    (clue, kwargs.get("attribute") or clue, kwargs)
+    for clue, _kwargs in CLUES.items()
+    for kwargs in _kwargs.values()
+)
+"""Flattened `CLUES` as (clue type, clue key, configuration settings) records"""
+
 # TODO: Remove this once `CLUES` have a better dataclass structure
 CLUE_TYPE_MAP = {
     "prime": "special_properties",
@@ -108,12 +116,6 @@ NEGATIVE_CONSTRAINT_CLUES = {
 }
 """Explicit clues to be included for the negative constraint."""
 
-if os.name == "nt":
-    MAPS_DB = os.path.join(os.path.dirname(__file__), "src", "maps_db")
-else:
-    MAPS_DB = os.path.join("home", "dafrizzy", "digits", "src", "maps_db")
-"""Path to the database of map files"""
-
 INSTRUCTIONS = """
 Can you guess what number I am?
 
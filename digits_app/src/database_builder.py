@@ -1,20 +1,33 @@
 """Map file database builder tools."""
-import os
-import pickle
-from typing import Any, Callable, Dict, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 import digits_app.src.clues.clue_map as cm
-from digits_app.src.constants import CLUES, MAPS_DB
+import numpy as np
+from digits_app.src.constants import CLUES
 from digits_app.src.utility_methods import (
+    MAPS_DB,
     default_map_to_key,
-    num_to_digits,
+    fibonacci_sieve,
+    iter_digits,
+    perfect_sieve,
+    prime_sieve,
+    save_map_file,
     snake_to_camelcase,
     timed,
 )
 
+SIEVES: Dict[str, Callable[[int], np.ndarray]] = {
+    "prime": prime_sieve,
+    "perfect": perfect_sieve,
+    "fibonacci": fibonacci_sieve,
+}
+"""Special properties that are sieved over the whole range instead of checked"""
+
 
 class MapsDatabaseBuilder:
-    """Builds a database of pkl files representing the numeric maps of every number
+    """Builds a database of npz map files representing the numeric maps of every number
     within a provided range
     """
 
@@ -32,29 +45,53 @@ class MapsDatabaseBuilder:
         self.paths = self.get_maps_paths(CLUES, self.difficulty)
         self.store_all_maps(CLUES)
 
+    def sieve(self, attribute: str) -> Optional[np.ndarray]:
+        """Lookup table of a special property for every number up to `self.max`.
+
+        Sieving the whole range once replaces a predicate call for every
+        sub-number of every value with an array lookup. Each special property's
+        maps are built in their own process, so only that property is sieved.
+
+        Returns:
+            Boolean array indexed by number, or None if the property has no sieve.
+        """
+        build_sieve = SIEVES.get(attribute)
+        return None if build_sieve is None else build_sieve(self.max)
+
     @staticmethod
     def get_maps_paths(
         clues: Dict[str, Dict[str, Dict[str, Any]]], difficulty: str
-    ) -> Dict[str, str]:
+    ) -> Dict[str, Path]:
         paths = {}
         for clue, _kwargs in clues.items():
             for kwargs in _kwargs.values():
                 key = kwargs.get("attribute") or clue
-                paths[key] = os.path.join(MAPS_DB, f"{difficulty}_{key}_maps.pkl")
+                paths[key] = MAPS_DB / f"{difficulty}_{key}_maps.npz"
         return paths
 
     def store_all_maps(self, clues: Dict[str, Dict[str, Dict[str, Any]]]):
-        for clue, _kwargs in clues.items():
-            func_name = f"store_{clue}_maps"
-            for kwargs in _kwargs.values():
-                key = kwargs.get("attribute") or clue
-                try:
-                    getattr(self, func_name)(path=self.paths[key], clue=clue, **kwargs)
-                except AttributeError:
-                    print(
-                        f"Function {func_name} not found. Continuing with other clues."
+        # Every map file is independent, so each one is built in its own process
+        with ProcessPoolExecutor() as executor:
+            futures = []
+            for clue, _kwargs in clues.items():
+                func_name = f"store_{clue}_maps"
+                for kwargs in _kwargs.values():
+                    key = kwargs.get("attribute") or clue
+                    try:
+                        store_func = getattr(self, func_name)
+                    except AttributeError:
+                        print(
+                            f"Function {func_name} not found. "
+                            "Continuing with other clues."
+                        )
+                        continue
+                    futures.append(
+                        executor.submit(
+                            store_func, path=self.paths[key], clue=clue, **kwargs
+                        )
                     )
-                    continue
+            for future in as_completed(futures):
+                future.result()
 
     @staticmethod
     def get_class(module: Callable, clue: str, base: str):
@@ -69,7 +106,7 @@ class MapsDatabaseBuilder:
     def store_simple_maps(
         self,
         max: int,
-        path: str,
+        path: Path,
         clue: str,
         map_key_func: Callable = default_map_to_key,
         **kwargs,
@@ -78,20 +115,63 @@ class MapsDatabaseBuilder:
         map_class = self.get_class(cm, clue, base="ClueMap")
         if not map_class:
             return
-        maps = {}
-        for val in range(1, max + 1):
-            digits = num_to_digits(val)
-            num_map = map_key_func(map_class(digits, **kwargs).num_map)
-            maps.setdefault(num_map, [])
-            maps[num_map].append(val)
-        with open(path, "wb") as file:
-            pickle.dump(maps, file)
+        build_maps = getattr(map_class, "build_maps", None)
+        if build_maps is not None and not kwargs:
+            maps = self.group_vectorized_maps(max, build_maps, map_key_func)
+        else:
+            maps = {}
+            for val, digits in iter_digits(max):
+                num_map = map_key_func(map_class(digits, **kwargs).num_map)
+                maps.setdefault(num_map, [])
+                maps[num_map].append(val)
+        save_map_file(path, maps)
         print(f"Saved {len(maps)} {clue} maps to disk.")
 
+    @staticmethod
+    def group_vectorized_maps(
+        max: int, build_maps: Callable, map_key_func: Callable = default_map_to_key
+    ) -> Dict[Any, List[int]]:
+        """Groups every number up to `max` by a map built for all numbers at once.
+
+        Numbers are handled one digit length at a time as a (N, D) digit array, and
+        `build_maps` returns the (N, K) array of their maps. Keys are inserted in
+        order of first appearance and values ascend, matching the per-number loop.
+        Maps of a fixed size (e.g. order) share keys across lengths and are merged.
+
+        Args:
+            max: Largest number to map.
+            build_maps: Vectorized map builder of a clue map class.
+            map_key_func: Converts a map (as a list) to its dictionary key.
+
+        Returns:
+            Dictionary of map keys to the numbers sharing that map.
+        """
+        maps = {}
+        for length in range(1, len(str(max)) + 1):
+            vals = np.arange(10 ** (length - 1), min(max, 10**length - 1) + 1)
+            if not len(vals):
+                break
+            places = 10 ** np.arange(length - 1, -1, -1)
+            # Digits and the maps built from them fit in int8, which keeps the
+            # arrays sorted by `np.unique` an eighth of the size of int64
+            digits = (vals[:, np.newaxis] // places % 10).astype(np.int8)
+            num_maps = build_maps(digits)
+            keys, first, inverse = np.unique(
+                num_maps, axis=0, return_index=True, return_inverse=True
+            )
+            inverse = inverse.reshape(-1)
+            # A stable sort by group keeps each group's values in ascending order
+            grouped = vals[np.argsort(inverse, kind="stable")]
+            groups = np.split(grouped, np.cumsum(np.bincount(inverse))[:-1])
+            for i in np.argsort(first):
+                key = map_key_func(keys[i].tolist())
+                maps.setdefault(key, []).extend(groups[i].tolist())
+        return maps
+
     def store_variety_maps(
         self,
         max: int,
-        path: str,
+        path: Path,
         clue: str,
         prop_func: Callable,
         attribute: str,
@@ -104,8 +184,7 @@ class MapsDatabaseBuilder:
             return
         maps = {}
         maps.setdefault(attribute, {})
-        for val in range(1, max + 1):
-            digits = num_to_digits(val)
+        for val, digits in iter_digits(max):
             map = map_key_func(
                 map_class(
                     digits,
@@ -117,14 +196,13 @@ class MapsDatabaseBuilder:
             maps[attribute].setdefault(map, [])
             maps[attribute][map].append(val)
         print(f"Found {len(maps[attribute].keys())} unique maps for {attribute}")
-        with open(path, "wb") as file:
-            pickle.dump(maps, file)
+        save_map_file(path, maps[attribute], attribute=attribute)
         print(f"Saved {attribute} maps to disk.")
 
     @timed
     def store_multiples_maps(
         self,
-        path: str,
+        path: Path,
         clue: str = "multiples",
         limits: Dict[str, Dict[str, int]] = None,
     ):
@@ -135,24 +213,26 @@ class MapsDatabaseBuilder:
         self.store_simple_maps(self.max, path, clue, _map_to_key, limit=limit)
 
     @timed
-    def store_total_sum_maps(self, path: str, clue: str = "total_sum"):
+    def store_total_sum_maps(self, path: Path, clue: str = "total_sum"):
         self.store_simple_maps(self.max, path, clue)
 
     @timed
-    def store_even_maps(self, path: str, clue: str):
+    def store_even_maps(self, path: Path, clue: str):
         self.store_simple_maps(self.max, path, clue)
 
     @timed
-    def store_order_maps(self, path: str, clue: str):
+    def store_order_maps(self, path: Path, clue: str):
         self.store_simple_maps(self.max, path, clue)
 
     @timed
     def store_special_properties_maps(
-        self, path: str, clue: str = "special_properties", **kwargs
+        self, path: Path, clue: str = "special_properties", **kwargs
     ):
         limit = kwargs.get("limits").get(self.difficulty).get("length")
-        prop_func = kwargs.get("prop_func")
         attribute = kwargs.get("attribute")
+        # Every candidate is a sub-number of a value in range, so it is <= self.max
+        sieve = self.sieve(attribute)
+        prop_func = kwargs.get("prop_func") if sieve is None else sieve.__getitem__
         self.store_variety_maps(
             max=self.max,
             path=path,
@@ -163,7 +243,7 @@ class MapsDatabaseBuilder:
         )
 
     @timed
-    def store_partials_maps(self, path: str, clue: str = "partials", **kwargs):
+    def store_partials_maps(self, path: Path, clue: str = "partials", **kwargs):
         prop_func = kwargs.get("prop_func")
         attribute = kwargs.get("attribute")
         self.store_variety_maps(
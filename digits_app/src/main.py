@@ -4,9 +4,11 @@ import sys
 from time import sleep
 from typing import Dict
 
-from digits_app.src.constants import CLUES, DIFFICULTY, INSTRUCTIONS
-from digits_app.src.database_builder import MapsDatabaseBuilder
-from digits_app.src.utility_methods import load_map_file
+from digits_app.src.constants import DIFFICULTY, INSTRUCTIONS
+from digits_app.src.utility_methods import LazyMapFiles
+
+FRAME_TIME = 0.016
+"""Approximate time (s) of one terminal frame, the shortest visible print delay"""
 
 
 class Digits:
@@ -43,26 +45,21 @@ class Digits:
         self.answer = answer
         self.map_files = map_files or self.load_map_files()
         if rebuild_db:
+            # Imported only to rebuild; playing never needs the builder's imports
+            from digits_app.src.database_builder import MapsDatabaseBuilder
+
             MapsDatabaseBuilder(self.min, self.max, self.difficulty)
         self.clues = None
 
     @staticmethod
     def load_map_files():
-        """Load all map pkl files for all difficulties and clue types.
+        """Set up lazily loaded map files for all difficulties and clue types.
 
         Returns:
-            Map file dictionaries keyed by difficulty and clue type
+            Map file dictionaries keyed by difficulty and clue type. Each map file is
+            loaded on first access.
         """
-        paths = {}
-        map_files = {}
-        for difficulty in DIFFICULTY.keys():
-            paths[difficulty] = MapsDatabaseBuilder.get_maps_paths(CLUES, difficulty)
-            map_files.setdefault(difficulty, {})
-            for key in paths[difficulty]:
-                map_files[difficulty].setdefault(key, {})
-                map_files[difficulty][key] = load_map_file(difficulty, key)
-
-        return map_files
+        return {difficulty: LazyMapFiles(difficulty) for difficulty in DIFFICULTY}
 
     def generate_answer(self, digits: int) -> int:
         """Generate a random number in the range of provided number of digits.
@@ -77,6 +74,21 @@ class Digits:
         self.max = 1 * 10 ** (digits) - 1
         return random.randint(self.min, self.max)
 
+    @staticmethod
+    def random_answer(digits: int) -> int:
+        """Generate a random number with the provided number of digits.
+
+        Unlike `generate_answer`, this does not store the range on the instance, so
+        it is safe to call from concurrent requests.
+
+        Args:
+            digits: Number of digits in the desired mystery number.
+
+        Returns:
+            Random integer in valid range of provided number of digits.
+        """
+        return random.randint(10 ** (digits - 1), 10**digits - 1)
+
     @staticmethod
     def delay_print(
         msg: str, delay: float = 0.04, newline: bool = True, overwrite: bool = False
@@ -88,10 +100,13 @@ class Digits:
             delay: Delay (s) between each character
             newline: Whether or not to print a new line at the end of the message
         """
-        for char in msg:
-            sys.stdout.write(char)
+        # Characters due within the same frame are written with one write and sleep
+        chunk_size = max(1, int(FRAME_TIME / delay)) if delay > 0 else len(msg) or 1
+        for i in range(0, len(msg), chunk_size):
+            chunk = msg[i : i + chunk_size]
+            sys.stdout.write(chunk)
             sys.stdout.flush()
-            sleep(delay)
+            sleep(delay * len(chunk))
         if overwrite:
             sys.stdout.write("\r")
         elif newline:
@@ -1,11 +1,17 @@
 """Clue solver application for reducing the set of clues needed to solve a number."""
+from functools import lru_cache
 from itertools import combinations
-from random import randint
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from random import choice
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
 
 import digits_app.src.clues.clue as c
 import digits_app.src.clues.clue_map as cm
-from digits_app.src.constants import CLUE_TYPE_MAP, CLUES, NEGATIVE_CONSTRAINT_CLUES
+from digits_app.src.constants import (
+    CLUE_TYPE_MAP,
+    CLUES,
+    DIFFICULTY,
+    NEGATIVE_CONSTRAINT_CLUES,
+)
 from digits_app.src.utility_methods import (
     default_map_to_key,
     digits_to_num,
@@ -13,6 +19,30 @@ from digits_app.src.utility_methods import (
     timed,
 )
 
+CLUE_TYPE_RENAMES = {"multiples": "divided"}
+"""Clue types displayed under a different name"""
+
+
+@lru_cache(maxsize=None)
+def format_clue_type(clue_type: str) -> str:
+    """Formats a clue type key for display (e.g. "total_sum" -> "TOTAL SUM")"""
+    new_key = CLUE_TYPE_RENAMES.get(clue_type) or clue_type
+    return new_key.upper().replace("_", " ")
+
+
+@lru_cache(maxsize=64)
+def _cm_name(clue: str, attribute: str = "") -> str:
+    """Name of the clue map class for a clue type and optional attribute
+
+    e.g. "total_sum" -> "TotalSumClueMap", ("partials", "sum") -> "SumPartialsClueMap"
+    """
+    return snake_to_camelcase(attribute) + snake_to_camelcase(clue) + "ClueMap"
+
+
+def _count_even(num_map: Tuple[int, ...]) -> int:
+    """Number of even digits represented by an even clue map"""
+    return num_map.count(1)
+
 
 class Solver:
     """Finds the smallest set of clues to provide the user for the given number that
@@ -58,55 +88,32 @@ class Solver:
             print(f"Answer was {self.answer}. Try another number.")
 
     def _filter_by_length(self, matches: Dict[str, List[int]]) -> Dict[str, List[int]]:
+        # Numbers with as many digits as the answer fall in [10^(n-1), 10^n)
+        answer_len = len(str(self.answer))
+        lo, hi = 10 ** (answer_len - 1), 10**answer_len
         for attr, _matches in matches.items():
-            matches[attr] = list(
-                filter(lambda match: len(str(match)) == len(str(self.answer)), _matches)
-            )
+            matches[attr] = [match for match in _matches if lo <= match < hi]
         return matches
 
-    @staticmethod
-    def format_clue_type(clue_type: str) -> str:
-        rename_map = {"multiples": "divided"}
-        renamed_type = rename_map.get(clue_type)
-        new_key = renamed_type or clue_type
-        return new_key.upper().replace("_", " ")
+    format_clue_type = staticmethod(format_clue_type)
 
     def add_negative_constraint_clues(self) -> None:
         for clue_type in self.final_clues:
-            negative_clue = NEGATIVE_CONSTRAINT_CLUES.get(clue_type)
-            limit_msg = None
+            negative_clue = NEGATIVE_CLUES.get((clue_type, self.difficulty))
             if negative_clue:
-                parent_clue_type = CLUE_TYPE_MAP.get(clue_type)
-                clue_type_config = (
-                    CLUES[parent_clue_type][clue_type]
-                    if parent_clue_type
-                    else CLUES[clue_type][clue_type]
-                )
-                if clue_type_config:
-                    limit_msg = self._format_limit_msg(clue_type_config)
-                formatted_clue = negative_clue.format(
-                    key=self.format_clue_type(clue_type), limit_msg=limit_msg
-                )
-                self.final_clues[clue_type].append(formatted_clue)
-
-    def _format_limit_msg(
-        self, clue_type_config: List[Dict[str, Any]]
-    ) -> Optional[str]:
-        limits = None
-        difficulty_limit = None
-        limit_msg = ""
-        if clue_type_config:
-            limits: Dict[str, Dict[str, int]] = clue_type_config.get("limits")
-        if limits:
-            difficulty_limit = limits[self.difficulty].get("length", None)
-            if not difficulty_limit:
-                return ""
-            limit_msg = (
-                f"1 or {difficulty_limit} digit "
-                if difficulty_limit > 1
-                else f"1-digit "
-            )
-        return limit_msg
+                self.final_clues[clue_type].append(negative_clue)
+
+    @staticmethod
+    def _format_limit_msg(clue_type_config: Dict[str, Any], difficulty: str) -> str:
+        if not clue_type_config:
+            return ""
+        limits: Dict[str, Dict[str, int]] = clue_type_config.get("limits")
+        if not limits:
+            return ""
+        difficulty_limit = limits.get(difficulty, {}).get("length")
+        if not difficulty_limit:
+            return ""
+        return f"1 or {difficulty_limit} digit " if difficulty_limit > 1 else "1-digit "
 
     def update_final_clue_keys(self) -> None:
         new_final_clues = {}
@@ -127,37 +134,24 @@ class Solver:
         clues_func = min if num_clues_filter == "min" else max
 
         # Determine min/max size/variety of clue types from all solved combinations
-        combo_size = combo_func([len(combo) for combo in solved_combos])
-
-        # Determine min/max number of clues from all solved combinations
-        clue_size = clues_func([info["num_clues"] for info in solved_combos.values()])
+        combo_size = combo_func(len(combo) for combo in solved_combos)
 
         # Pull the min/max combos based only on the min/max combination size
-        combos = dict(
-            filter(lambda item: len(item[0]) == combo_size, solved_combos.items())
-        )
-
-        # Pull the min/max combos based only on the min/max number of clues
-        # (Not typically used since the combos should probably be filtered by combo size first)
-        clues = dict(
-            filter(
-                lambda item: item[1]["num_clues"] == clue_size,
-                solved_combos.items(),
-            )
-        )
+        combos = {
+            combo: info
+            for combo, info in solved_combos.items()
+            if len(combo) == combo_size
+        }
 
         # Determine min/max number of clues for each min/max combination size
-        num_clues = clues_func([info["num_clues"] for info in combos.values()])
+        num_clues = clues_func(info["num_clues"] for info in combos.values())
 
-        # Pull the combos with the min/max number of clues from the min/max combos
-        funnest_combos = dict(
-            filter(
-                lambda item: item[1]["num_clues"] == num_clues,
-                combos.items(),
-            )
-        )
-        clue_num = randint(0, len(funnest_combos.keys()) - 1)
-        return list(funnest_combos.items())[clue_num][1]["clues"], combo_size
+        # Pull the clues of the combos with the min/max number of clues from the
+        # min/max combos and pick one at random
+        funnest_clues = [
+            info["clues"] for info in combos.values() if info["num_clues"] == num_clues
+        ]
+        return choice(funnest_clues), combo_size
 
     @timed
     def find_overlaps(
@@ -179,30 +173,44 @@ class Solver:
         """
         solved_combos = {}
         solved = False
+        # Each clue type's matches are hashed once rather than once per combination.
+        # Clue types whose matches miss the answer can't narrow it down, so they are
+        # left out of the combinations entirely.
+        match_sets = {}
+        for attr, matches in all_matches.items():
+            match_set = frozenset(matches)
+            if self.answer in match_set:
+                match_sets[attr] = match_set
         clue_types = (  # Provide max number of clue types if in easy mode
-            range(len(all_matches), 0, -1)
+            range(len(match_sets), 0, -1)
             if self.difficulty == "easy"
-            else range(1, len(all_matches) + 1)
+            else range(1, len(match_sets) + 1)
         )
+        clue_lens = {attr: len(clues) for attr, clues in self.clues.items()}
         for size in clue_types:
             # size represents a combination size of several clue types
             # e.g. If the combination is ["prime", "product", "even"] then size == 3
-            for combo in map(dict, combinations(all_matches.items(), size)):
-                # combo is a dict keyed by clue type/attribute, values are lists of matching numbers
-                # that share clue maps for each clue type.
-                # e.g. combo = {"prime": [1234, 5678], "product": [1234, 2468], "even": [1234, 3456]}
-                overlapping_nums = set.intersection(*map(set, combo.values()))
+            for combo in combinations(match_sets, size):
+                # combo is a tuple of clue types/attributes whose sets of matching numbers
+                # share clue maps with the answer for each clue type.
+                # e.g. combo = ("prime", "product", "even")
+                # Intersect smallest-first so the running set stays small, and stop
+                # as soon as nothing overlaps
+                ordered = sorted((match_sets[attr] for attr in combo), key=len)
+                overlapping_nums = ordered[0]
+                for match_set in ordered[1:]:
+                    if not overlapping_nums:
+                        break
+                    overlapping_nums = overlapping_nums.intersection(match_set)
                 if len(overlapping_nums) == 1:
-                    combo_clues = dict(
-                        filter(lambda item: item[0] in combo, self.clues.items())
-                    )
-                    num_clues = sum([len(clues) for clues in combo_clues.values()])
-                    solved_combos[tuple(combo.keys())] = {
+                    combo_clues = {attr: self.clues[attr] for attr in combo}
+                    num_clues = sum(clue_lens[attr] for attr in combo)
+                    solved_combos[combo] = {
                         "clues": combo_clues,
                         "num_clues": num_clues,
                     }
                     solved = True
-                    # print(f"Solved combo: {list(combo.keys())}. Num clues: {num_clues}")
+                    # print(f"Solved combo: {list(combo)}. Num clues: {num_clues}")
             if solved:
                 break
         return solved_combos
@@ -221,19 +229,17 @@ class Solver:
         """
         matches = {}
         for clue, _kwargs in clues.items():
-            func_name = f"get_{clue}_matches"
+            matcher = _MATCHERS.get(clue)
+            if matcher is None:
+                print(
+                    f"Function get_{clue}_matches not found. "
+                    "Continuing with other clues."
+                )
+                continue
             for kwargs in _kwargs.values():
                 key = kwargs.get("attribute") or clue
                 map_file = self.map_files[self.difficulty][key]
-                try:
-                    c_matches = getattr(self, func_name)(
-                        map_file=map_file, clue=clue, **kwargs
-                    )
-                except AttributeError:
-                    print(
-                        f"Function {func_name} not found. Continuing with other clues."
-                    )
-                    continue
+                c_matches = matcher(self, map_file=map_file, clue=clue, **kwargs)
                 if isinstance(c_matches, list):
                     matches[clue] = c_matches
                 elif isinstance(c_matches, dict):
@@ -264,7 +270,7 @@ class Solver:
                 by the clue type.
         """
         matches = []
-        cm_name = snake_to_camelcase(clue) + "ClueMap"
+        cm_name = _cm_name(clue)
         num_map = self.maps.get(cm_name)
         try:
             num_map = map_key_func(num_map)
@@ -310,9 +316,8 @@ class Solver:
             matches: Numbers with matching numeric maps for the given clue type, keyed
                 by the attribute rather than the higher-level clue type.
         """
-        cm_base = snake_to_camelcase(clue) + "ClueMap"
         matches = {}
-        cm_name = snake_to_camelcase(attribute) + cm_base
+        cm_name = _cm_name(clue, attribute)
         answer_map = self.maps.get(cm_name)
         answer_map = map_key_func(answer_map)
         matching_nums = all_maps[attribute][answer_map]
@@ -341,18 +346,10 @@ class Solver:
     @timed
     def get_even_matches(self, map_file: Dict, clue: str = "even") -> List[int]:
         """Gets matches of numeric maps for even clues"""
-        matches = []
-        cm_name = snake_to_camelcase(clue) + "ClueMap"
-        num_map = self.maps.get(cm_name)
-        matching_maps = {
-            candidate_map: map_file[candidate_map]
-            for candidate_map in map_file
-            if candidate_map.count(1) == num_map.count(1)
-        }
-        num_map = default_map_to_key(num_map)
-        for map in matching_maps:
-            matches.extend(map_file[map])
-        return matches
+        cm_name = _cm_name(clue)
+        num_even = _count_even(self.maps.get(cm_name))
+        # Maps are bucketed by their even count once per map file
+        return list(map_file.group_by(_count_even).get(num_even, []))
 
     @timed
     def get_order_matches(self, map_file: Dict, clue: str = "even") -> List[int]:
@@ -376,3 +373,39 @@ class Solver:
         return self.get_variety_matches(
             map_file, clue, attribute=kwargs.get("attribute")
         )
+
+
+_MATCHERS: Dict[str, Callable] = {
+    clue: getattr(Solver, f"get_{clue}_matches")
+    for clue in CLUES
+    if hasattr(Solver, f"get_{clue}_matches")
+}
+"""`Solver` match functions keyed by clue type"""
+
+
+def _build_negative_clues() -> Dict[Tuple[str, str], str]:
+    """Formats every negative constraint clue for each difficulty.
+
+    Returns:
+        Negative constraint clues keyed by (clue type, difficulty).
+    """
+    negative_clues = {}
+    for clue_type, negative_clue in NEGATIVE_CONSTRAINT_CLUES.items():
+        parent_clue_type = CLUE_TYPE_MAP.get(clue_type)
+        clue_type_config = (
+            CLUES[parent_clue_type][clue_type]
+            if parent_clue_type
+            else CLUES[clue_type][clue_type]
+        )
+        for difficulty in DIFFICULTY:
+            limit_msg = None
+            if clue_type_config:
+                limit_msg = Solver._format_limit_msg(clue_type_config, difficulty)
+            negative_clues[clue_type, difficulty] = negative_clue.format(
+                key=Solver.format_clue_type(clue_type), limit_msg=limit_msg
+            )
+    return negative_clues
+
+
+NEGATIVE_CLUES = _build_negative_clues()
+"""Formatted negative constraint clues keyed by (clue type, difficulty)"""
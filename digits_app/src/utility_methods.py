@@ -1,28 +1,133 @@
 """Collection of utility methods."""
+import json
 import math
 import os
-import pickle
-from functools import wraps
-from time import time
-from typing import List
+import re
+from collections.abc import Mapping
+from functools import lru_cache, wraps
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 
-def bold(key: str) -> str:
-    """Bolds a provided string"""
-    return key.upper()
-    # return "\033[1m{}\033[0m".format(key)
+bold: Callable[[str], str] = str.upper
+"""Bolds a provided string"""
+# bold = "\033[1m{}\033[0m".format
 
 
-def is_fibonacci(num: int) -> bool:
-    """Determines if the provided value is part of the Fibonacci sequence"""
+def _fibonacci_numbers(max: int) -> frozenset:
+    """Builds the set of Fibonacci numbers from 0 to `max`"""
+    fibs = set()
+    a, b = 0, 1
+    while a <= max:
+        fibs.add(a)
+        a, b = b, a + b
+    return frozenset(fibs)
 
-    def _is_perfect_square(val: int):
-        s = int(math.sqrt(val))
-        return s * s == val
 
-    return _is_perfect_square(5 * num * num + 4) or _is_perfect_square(
-        5 * num * num - 4
-    )
+_FIBS = _fibonacci_numbers(10**18)
+"""Fibonacci numbers up to 10^18, far beyond any number the game builds"""
+
+# Set membership predicates are bound to the set's C-level `__contains__`, so each
+# check is a single builtin call with no Python frame to set up.
+is_fibonacci: Callable[[int], bool] = _FIBS.__contains__
+"""Determines if the provided value is part of the Fibonacci sequence"""
+
+
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+"""Primes used for trial division before running Miller-Rabin"""
+
+_MR_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+"""Miller-Rabin witnesses that are deterministic for every n < 2^64"""
+
+
+def is_prime_fast(num: int) -> bool:
+    """Determines if the provided value is prime
+
+    Uses trial division by small primes followed by a deterministic Miller-Rabin
+    test, which is exact for every value below 2^64.
+    """
+    if num < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if num % p == 0:
+            return num == p
+    d, s = num - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        a %= num
+        if a == 0:
+            continue
+        x = pow(a, d, num)
+        if x == 1 or x == num - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % num
+            if x == num - 1:
+                break
+        else:
+            return False
+    return True
+
+
+_PERFECTS = frozenset({6, 28, 496, 8128, 33550336, 8589869056, 137438691328})
+"""Perfect numbers below 10^12, far beyond any number the game builds"""
+
+is_perfect_fast: Callable[[int], bool] = _PERFECTS.__contains__
+"""Determines if the provided value is a perfect number"""
+
+
+def prime_sieve(max: int) -> np.ndarray:
+    """Sieve of Eratosthenes marking every prime from 0 to `max`"""
+    sieve = np.ones(max + 1, dtype=bool)
+    sieve[:2] = False
+    for val in range(2, math.isqrt(max) + 1):
+        if sieve[val]:
+            sieve[val * val :: val] = False
+    return sieve
+
+
+_PRIME_TABLE = prime_sieve(10**6 - 1).tobytes()
+"""Primality of every number with up to 6 digits, the most an answer can have"""
+
+
+def is_prime(num: int) -> bool:
+    """Determines if the provided value is prime
+
+    Looks the value up in `_PRIME_TABLE`, only falling back to `is_prime_fast` for
+    values outside of it (including negative values, which are never prime).
+    """
+    if 0 <= num < len(_PRIME_TABLE):
+        return _PRIME_TABLE[num] == 1
+    return is_prime_fast(num)
+
+
+def fibonacci_sieve(max: int) -> np.ndarray:
+    """Marks every Fibonacci number from 0 to `max`"""
+    sieve = np.zeros(max + 1, dtype=bool)
+    a, b = 0, 1
+    while a <= max:
+        sieve[a] = True
+        a, b = b, a + b
+    return sieve
+
+
+def perfect_sieve(max: int) -> np.ndarray:
+    """Marks every perfect number from 0 to `max`
+
+    Uses the Euclid-Euler theorem: even perfect numbers are 2^(p-1) * (2^p - 1) for
+    Mersenne primes 2^p - 1, and no odd perfect numbers exist in any usable range.
+    """
+    sieve = np.zeros(max + 1, dtype=bool)
+    p = 2
+    while 2 ** (p - 1) * (2**p - 1) <= max:
+        if is_prime_fast(2**p - 1):
+            sieve[2 ** (p - 1) * (2**p - 1)] = True
+        p += 1
+    return sieve
 
 
 def check_sum(x: int, y: int, target: int) -> bool:
@@ -35,57 +140,209 @@ def check_product(x: int, y: int, target: int) -> bool:
     return x * y == target
 
 
+_ASCII_TO_DIGIT = bytes.maketrans(b"0123456789", bytes(range(10)))
+"""Byte translation table from ASCII digit characters to their digit values"""
+
+
 def num_to_digits(num: int) -> List[int]:
     """Convert number to a list of digits"""
-    return [int(dig) for dig in str(num)]
+    if num < 0:
+        raise ValueError(f"Cannot convert negative number {num} to digits")
+    # Translating the ASCII digits to digit values happens in one C-level pass
+    return list((b"%d" % num).translate(_ASCII_TO_DIGIT))
+
+
+def iter_digits(max: int) -> Iterator[Tuple[int, List[int]]]:
+    """Yields every number from 1 to `max` along with its list of digits.
+
+    The digits are kept in a single list that is incremented in place with carries,
+    which avoids formatting and parsing a string per number. The yielded list is
+    reused between iterations, so copy it if it needs to outlive the loop body.
+    """
+    digits = [0]
+    for val in range(1, max + 1):
+        i = len(digits) - 1
+        while i >= 0 and digits[i] == 9:
+            digits[i] = 0
+            i -= 1
+        if i < 0:
+            digits.insert(0, 1)
+        else:
+            digits[i] += 1
+        yield val, digits
 
 
 def digits_to_num(digits: List[int]) -> int:
-    """Convert number to a list of digits"""
-    return int("".join([str(d) for d in digits]))
+    """Convert a list of digits to a number"""
+    num = 0
+    for digit in digits:
+        num = num * 10 + digit
+    return num
+
+
+PROFILE = bool(os.environ.get("DIGITS_PROFILE"))
+"""Whether `timed` functions log their run time, set by the DIGITS_PROFILE env var"""
 
 
 def timed(func):
-    """Logs the amount of time taken to run a function"""
+    """Logs the amount of time taken to run a function
+
+    Returns `func` itself unless profiling is enabled, so timed functions carry no
+    overhead in normal runs.
+    """
+    if not PROFILE:
+        return func
 
     @wraps(func)
     def wrap(*args, **kwargs):
-        start = time()
+        start = perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time()
-        # print(
-        #     "Function: %r executed. Elapsed time: %2.3f sec"
-        #     % (func.__name__, end - start)
-        # )
+        end = perf_counter_ns()
+        print(
+            "Function: %r executed. Elapsed time: %2.3f sec"
+            % (func.__name__, (end - start) / 1e9)
+        )
         return result
 
     return wrap
 
 
+_SNAKE_WORD_START = re.compile(r"(?:^|_)([a-z])")
+"""First letter of each word of a snake_case name, with its leading underscore"""
+
+
 def snake_to_camelcase(name: str) -> str:
     """Converts a snake_case variable name to CamelCase format"""
-    words = name.split("_")
-    return "".join(map(str.title, words))
+    return _SNAKE_WORD_START.sub(lambda match: match.group(1).upper(), name)
 
 
 def default_map_to_key(num_map: List):
-    """Default conversion of a numeric map to a key for the pkl object"""
+    """Default conversion of a numeric map to a key for the map file"""
     return tuple(num_map)
 
 
+def _encode_map_key(key: Any) -> str:
+    """Encodes a map key as compact JSON, casting NumPy integers to plain ints"""
+    return json.dumps(key, separators=(",", ":"), default=int)
+
+
+def _decode_map_key(item: Any) -> Any:
+    """Rebuilds the (nested) tuple map key from its decoded JSON lists"""
+    return tuple(map(_decode_map_key, item)) if isinstance(item, list) else item
+
+
+class MapFile(Mapping):
+    """Read-only map file of numeric map keys to the numbers sharing each map.
+
+    All numbers are held in one flat int32 array; the numbers for the i-th key are
+    `values[offsets[i] : offsets[i + 1]]`. Keys are indexed by their JSON encoding,
+    so lookups only encode the requested key and never decode the stored ones.
+    """
+
+    __slots__ = ("_index", "_offsets", "_values", "_groups")
+
+    def __init__(self, keys: List[str], offsets: np.ndarray, values: np.ndarray):
+        self._index = {key: i for i, key in enumerate(keys)}
+        self._offsets = offsets
+        self._values = values
+        self._groups: Dict[Callable, Dict[Any, List[int]]] = {}
+
+    def __getitem__(self, key: Any) -> List[int]:
+        i = self._index[_encode_map_key(key)]
+        return self._values[self._offsets[i] : self._offsets[i + 1]].tolist()
+
+    def __contains__(self, key: Any) -> bool:
+        return _encode_map_key(key) in self._index
+
+    def __iter__(self) -> Iterator[Any]:
+        return (_decode_map_key(json.loads(key)) for key in self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def group_by(self, signature: Callable[[Any], Any]) -> Dict[Any, List[int]]:
+        """Numbers of every map grouped by `signature(map key)`, in map file order.
+
+        The groups are built by one pass over the map file the first time a
+        signature is used and then cached, so queries on a function of the map key
+        become a dict lookup instead of a scan of every key.
+        """
+        groups = self._groups.get(signature)
+        if groups is None:
+            groups = {}
+            for key in self:
+                groups.setdefault(signature(key), []).extend(self[key])
+            self._groups[signature] = groups
+        return groups
+
+
+def save_map_file(
+    path: Path, maps: Dict[Any, List[int]], attribute: Optional[str] = None
+) -> None:
+    """Saves a map dictionary to a compressed npz map file
+
+    Args:
+        path: Path of the npz file
+        maps: Numeric map keys to the numbers sharing each map
+        attribute: Attribute the maps are nested under for variety clue types
+    """
+    keys = "\n".join(_encode_map_key(key) for key in maps)
+    offsets = np.zeros(len(maps) + 1, dtype=np.int32)
+    np.cumsum([len(vals) for vals in maps.values()], out=offsets[1:])
+    values = [val for vals in maps.values() for val in vals]
+    arrays = {
+        "keys": np.frombuffer(keys.encode(), dtype=np.uint8),
+        "offsets": offsets,
+        "values": np.asarray(values, dtype=np.int32),
+    }
+    if attribute is not None:
+        arrays["attribute"] = np.array(attribute)
+    np.savez_compressed(path, **arrays)
+
+
+MAPS_DB = Path(__file__).resolve().parent / "maps_db"
+"""Path to the database of map files"""
+
+
+@lru_cache(maxsize=None)
 @timed
-def load_map_file(difficulty: str, key: str) -> pickle.OBJ:
+def load_map_file(difficulty: str, key: str) -> Dict:
     """Builds path of map file from difficulty and clue key
 
+    Map files are read-only, so each one is loaded once per process and shared by
+    every caller, including separate `LazyMapFiles` instances.
+
     Args:
         difficulty: Difficulty level
         key: Clue key (e.g. 'divide', 'prime', 'sum', etc.)
 
     Returns:
-        Loaded map file as a pickle object
+        Loaded `MapFile`, nested under its attribute for variety clue types
+    """
+    path = MAPS_DB / f"{difficulty}_{key}_maps.npz"
+    # Map files only hold plain arrays, so pickled objects are never loaded
+    with np.load(path, allow_pickle=False) as data:
+        keys = data["keys"].tobytes().decode()
+        offsets, values = data["offsets"], data["values"]
+        # The arrays are shared by every caller of the cached loader
+        offsets.flags.writeable = values.flags.writeable = False
+        map_file = MapFile(keys.split("\n") if keys else [], offsets, values)
+        if "attribute" in data:
+            return {str(data["attribute"]): map_file}
+    return map_file
+
+
+class LazyMapFiles(dict):
+    """Map files of a single difficulty keyed by clue key.
+
+    Each map file is loaded from disk the first time it is accessed, so only the
+    difficulties and clue types that are actually played get loaded.
     """
-    path = os.path.join(
-        os.path.dirname(__file__), "maps_db", f"{difficulty}_{key}_maps.pkl"
-    )
-    with open(path, "rb") as file:
-        return pickle.load(file)
+
+    def __init__(self, difficulty: str) -> None:
+        super().__init__()
+        self.difficulty = difficulty
+
+    def __missing__(self, key: str) -> Dict:
+        map_file = self[key] = load_map_file(self.difficulty, key)
+        return map_file
@@ -0,0 +1,51 @@
+"""Tests for the Flask app routes."""
+import json
+import unittest
+
+from digits_app.app import _guess_clues, app
+
+CLUES = {"EVEN": ["1 of my digits is EVEN"]}
+
+
+class GuessTest(unittest.TestCase):
+    def setUp(self):
+        app.config["WTF_CSRF_ENABLED"] = False
+        self.client = app.test_client()
+        with self.client.session_transaction() as session:
+            session["answer"] = 123
+            session["num_digits"] = 3
+            session["difficulty"] = "medium"
+            session["clues_json"] = json.dumps(CLUES)
+
+    def post_guess(self, *digits: str) -> str:
+        form = {f"digit_{i + 1}": digit for i, digit in enumerate(digits)}
+        form["submit_guess"] = "Guess"
+        return self.client.post("/guess", data=form).get_data(as_text=True)
+
+    def test_single_digits_build_the_guess(self):
+        page = self.post_guess("1", "2", "3")
+        self.assertIn("You guessed <strong>123</strong>", page)
+
+    def test_multi_digit_entry_is_reported(self):
+        page = self.post_guess("1", "12", "3")
+        self.assertNotIn("You guessed", page)
+        self.assertIn("Digit 2: Number must be between 0 and 9.", page)
+
+    def test_non_numeric_entry_is_reported(self):
+        page = self.post_guess("1", "x", "3")
+        self.assertNotIn("You guessed", page)
+        self.assertIn("Digit 2: Not a valid integer value.", page)
+
+    def test_hint_highlights_against_shared_guess_clues(self):
+        form = {"digit_1": "1", "digit_2": "2", "digit_3": "4", "submit_hint": "Hint"}
+        response = self.client.post("/guess", data=form)
+        self.assertEqual(response.status_code, 200)
+
+        # The cached guess clues are shared by every session, so they are read-only
+        guess_clues = _guess_clues(124, "medium")
+        with self.assertRaises(TypeError):
+            guess_clues["EVEN"] = frozenset()
+
+
+if __name__ == "__main__":
+    unittest.main()
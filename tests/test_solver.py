@@ -0,0 +1,81 @@
+"""Tests for the clue solver."""
+import unittest
+from itertools import combinations
+
+from digits_app.src.clues.clue_generator import ClueGenerator
+from digits_app.src.main import Digits
+from digits_app.src.solver import Solver
+
+MAP_FILES = Digits.load_map_files()
+
+ANSWERS = (123, 4096, 10203, 31415, 271828, 999999)
+
+
+def _reference_candidates(solver: Solver, all_matches):
+    """Every solved combination of the smallest solvable size, found exhaustively"""
+    match_sets = {attr: set(matches) for attr, matches in all_matches.items()}
+    for size in range(1, len(match_sets) + 1):
+        solved = {}
+        for combo in combinations(match_sets, size):
+            if set.intersection(*(match_sets[attr] for attr in combo)) == {
+                solver.answer
+            }:
+                solved[combo] = sum(len(solver.clues[attr]) for attr in combo)
+        if solved:
+            return solved
+    return {}
+
+
+def _bare_solver(answer: int, clues, difficulty: str = "medium") -> Solver:
+    """Solver with only the attributes `find_overlaps` uses, skipping the full solve"""
+    solver = Solver.__new__(Solver)
+    solver.answer = answer
+    solver.difficulty = difficulty
+    solver.clues = clues
+    return solver
+
+
+class FindOverlapsTest(unittest.TestCase):
+    def test_collects_every_solved_combination_of_the_smallest_size(self):
+        # Every clue type narrows the answer down alone, and the clue type with the
+        # fewest clues comes last in dict order
+        attrs = [f"clue_{i}" for i in range(20)]
+        clues = {attr: ["clue"] * 3 for attr in attrs}
+        clues[attrs[-1]] = ["clue"]
+        solver = _bare_solver(123, clues)
+        matches = {attr: [123] for attr in attrs}
+
+        solved_combos = solver.find_overlaps(matches)
+
+        self.assertEqual(set(solved_combos), {(attr,) for attr in attrs})
+        final_clues, _ = Solver.find_most_fun_clues(solved_combos)
+        self.assertEqual(list(final_clues), [attrs[-1]])
+
+    def test_candidate_pool_matches_exhaustive_search(self):
+        # find_most_fun_clues picks uniformly among the solved combos with the fewest
+        # clues, so an identical pool means an identical clue set distribution
+        for difficulty in ("medium", "hard"):
+            for answer in ANSWERS:
+                with self.subTest(difficulty=difficulty, answer=answer):
+                    clue_gen = ClueGenerator(answer, difficulty)
+                    solver = Solver(
+                        clue_gen.digits,
+                        clue_gen.num_maps,
+                        clue_gen.clues,
+                        difficulty,
+                        MAP_FILES,
+                    )
+                    matches = solver._filter_by_length(solver.get_all_matches())
+                    solved_combos = solver.find_overlaps(matches)
+                    expected = _reference_candidates(solver, matches)
+                    self.assertEqual(
+                        {
+                            combo: info["num_clues"]
+                            for combo, info in solved_combos.items()
+                        },
+                        expected,
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for the utility methods."""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from digits_app.src.utility_methods import (
+    MapFile,
+    is_prime,
+    is_prime_fast,
+    load_map_file,
+    save_map_file,
+)
+
+PARTIALS_MAPS = {
+    ((), ((0, 2),), ((0, 1),)): [123, 246],
+    ((), (), ()): [100, 105, 999],
+    ((), ((0, 2),), ((0, 1), (1, 2))): [7],
+    ((), (), ((0, 1),)): [112, 134],
+}
+"""Partials maps with nested tuple keys, in insertion order"""
+
+
+class IsPrimeTest(unittest.TestCase):
+    def test_zero_and_one_are_not_prime(self):
+        self.assertFalse(is_prime(0))
+        self.assertFalse(is_prime(1))
+
+    def test_negative_values_are_not_prime(self):
+        # -999983 would index the table from the end, where 999983 is prime
+        for num in (-1, -2, -3, -999983):
+            with self.subTest(num=num):
+                self.assertFalse(is_prime(num))
+
+    def test_matches_miller_rabin_inside_and_beyond_the_table(self):
+        for num in (*range(2, 1000), 999983, 999999, 1000003, 1000033):
+            with self.subTest(num=num):
+                self.assertEqual(is_prime(num), is_prime_fast(num))
+
+
+class MapFileTest(unittest.TestCase):
+    def load(self, maps, attribute=None):
+        """Saves `maps` to a temporary map file and loads it back uncached"""
+        with tempfile.TemporaryDirectory() as maps_db:
+            save_map_file(Path(maps_db) / "test_sum_maps.npz", maps, attribute)
+            with mock.patch("digits_app.src.utility_methods.MAPS_DB", Path(maps_db)):
+                return load_map_file.__wrapped__("test", "sum")
+
+    def test_round_trip_keeps_maps_and_key_order(self):
+        map_file = self.load(PARTIALS_MAPS, attribute="sum")["sum"]
+        self.assertIsInstance(map_file, MapFile)
+        self.assertEqual(dict(map_file), PARTIALS_MAPS)
+        self.assertEqual(list(map_file), list(PARTIALS_MAPS))
+        self.assertNotIn(((), (), ((1, 2),)), map_file)
+
+    def test_round_trip_without_attribute(self):
+        maps = {(1, 0): [12, 13], (0, 1): [10], (1, 1): [1, 2, 3]}
+        map_file = self.load(maps)
+        self.assertEqual(dict(map_file), maps)
+        self.assertEqual(list(map_file), list(maps))
+
+    def test_empty_map_file(self):
+        self.assertEqual(dict(self.load({})), {})
+
+    def test_group_by(self):
+        map_file = self.load(PARTIALS_MAPS, attribute="sum")["sum"]
+
+        def num_sum_digits(key):
+            return sum(1 for row in key if row)
+
+        groups = map_file.group_by(num_sum_digits)
+        self.assertEqual(groups, {2: [123, 246, 7], 0: [100, 105, 999], 1: [112, 134]})
+        self.assertEqual(list(groups), [2, 0, 1])
+        self.assertIs(map_file.group_by(num_sum_digits), groups)
+
+
+class LoadMapFileTest(unittest.TestCase):
+    def test_order_maps(self):
+        order = load_map_file("medium", "order")
+        self.assertEqual(list(order), [(1, 1), (0, 1), (1, 0), (0, 0)])
+        self.assertEqual(len(order[(1, 1)]), 54)
+        self.assertEqual(order[(1, 1)][:6], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(order[(0, 1)]), 7947)
+        self.assertEqual(order[(0, 1)][:6], [10, 20, 21, 30, 31, 32])
+
+    def test_partials_maps(self):
+        sums = load_map_file("medium", "sum")["sum"]
+        self.assertEqual(len(sums), 66288)
+        self.assertEqual(sums[((),)], [1, 2, 3, 4, 5, 6, 7, 8, 9])
+        key = ((), (), ((0, 1),))
+        self.assertEqual(len(sums[key]), 36)
+        self.assertEqual(sums[key][:6], [112, 123, 134, 145, 156, 167])
+
+    def test_special_properties_maps(self):
+        primes = load_map_file("medium", "prime")["prime"]
+        self.assertEqual(len(primes), 2048)
+        self.assertEqual(len(primes[(12,)]), 4227)
+        self.assertEqual(primes[(12,)][:6], [11, 19, 41, 61, 89, 110])
+
+
+if __name__ == "__main__":
+    unittest.main()